@@ -1,8 +1,206 @@
 #! /usr/bin/env python3
 
-import datetime
+import asyncio
+import concurrent.futures
 import json
+import logging
+import re
 import requests
+import time
+
+from requests.adapters import HTTPAdapter
+from urllib3.util.retry import Retry
+
+try:
+    import httpx
+except ImportError:
+    httpx = None
+
+try:
+    import ijson
+except ImportError:
+    ijson = None
+
+try:
+    import orjson
+except ImportError:
+    orjson = None
+
+if orjson is not None:
+    _json_dumps = orjson.dumps
+    _json_loads = orjson.loads
+else:
+    def _json_dumps(obj):
+        return json.dumps(obj, separators=(',', ':')).encode()
+    _json_loads = json.loads
+
+
+_log = logging.getLogger(__name__)
+
+# connection pool and retry tuning for the persistent session. The client talks
+# to a single host, so one pool sized for the worker fan-out is enough
+_POOL_CONNECTIONS = 1
+_POOL_MAXSIZE = 64
+_RETRY_TOTAL = 3
+_RETRY_BACKOFF = 0.2
+_RETRY_STATUSES = [502, 503, 504]
+
+
+def _decode(resp):
+    """
+    _decode(resp)
+
+    _decode parses a response body straight from the raw bytes, with orjson
+    when it is installed and the stdlib json module otherwise, skipping the
+    intermediate text decode and encoding detection that Response.json()
+    performs. Empty bodies, ex. a 204 on delete, decode to None instead of
+    raising
+
+    Params:
+        resp : the response object to decode
+    """
+    body = resp.content
+    if not body:
+        return None
+    return _json_loads(body)
+
+
+def _compact(**kwargs):
+    """
+    _compact(**kwargs)
+
+    _compact builds a dict from kwargs, dropping None and empty-string values in
+    a single C-level dict comprehension instead of one _add_to_dict call per
+    field. An expand flag is converted to the lowercase string the API expects
+
+    Params:
+        kwargs : the candidate key/value pairs
+    """
+    return {k: (str(v).lower() if k == 'expand' else v) for k, v in kwargs.items() if v is not None and v != ''}
+
+
+def _make_get_by_id(path):
+    """
+    _make_get_by_id(path)
+
+    _make_get_by_id builds a get_*_by_id method for one endpoint at class
+    definition time. Each generated method is a closure specialized to its
+    collection path, replacing a hand-rolled copy of the same three lines
+
+    Params:
+        path : str : the collection path, ex. '/api/v1/hardware'
+    """
+    prefix = path + '/'
+
+    def get_by_id(self, entity_id):
+        self._precondition_int(entity_id)
+        return self._get(prefix + str(entity_id), None)
+    return get_by_id
+
+
+def _make_delete(path, invalidate=None):
+    """
+    _make_delete(path, invalidate=None)
+
+    _make_delete builds a delete_* method for one endpoint at class definition
+    time, mirroring _make_get_by_id
+
+    Params:
+        path : str : the collection path, ex. '/api/v1/hardware'
+        invalidate : str : a response cache family to drop before deleting, for
+            endpoints whose listings are memoized
+    """
+    prefix = path + '/'
+
+    def delete(self, entity_id):
+        self._precondition_int(entity_id)
+        if invalidate is not None:
+            self._invalidate(invalidate)
+        return self._delete(prefix + str(entity_id), None, parse=False)
+    return delete
+
+
+def _make_sync_only(name):
+    """
+    _make_sync_only(name)
+
+    _make_sync_only builds an AsyncSnipeAPI override for a helper that drives
+    the response in synchronous python and therefore cannot work on top of the
+    coroutine HTTP verbs. Raising up front beats a TypeError mid-iteration
+
+    Params:
+        name : str : the helper being stubbed out, ex. 'iter_assets'
+    """
+    def sync_only(self, *args, **kwargs):
+        raise NotImplementedError(f'{name} consumes responses synchronously and is not available on AsyncSnipeAPI; use the *_by_id methods, bulk_get_assets_by_id, or asyncio.gather over the endpoint coroutines')
+    sync_only.__name__ = name
+    return sync_only
+
+
+_DATE_RE = re.compile(r'^\d{4}-(0[1-9]|1[0-2])-(0[1-9]|[12]\d|3[01])$')
+
+_VALIDATOR_TYPES = {
+    'str': str,
+    'int': int,
+    'float': float,
+    'bool': bool,
+    'list': list,
+}
+
+_P_ACCESSORIES = '/api/v1/accessories'
+_P_HARDWARE = '/api/v1/hardware'
+_P_CATEGORIES = '/api/v1/categories'
+_P_COMPANIES = '/api/v1/companies'
+_P_COMPONENTS = '/api/v1/components'
+_P_CONSUMABLES = '/api/v1/consumables'
+_P_FIELDS = '/api/v1/fields'
+_P_FIELDSETS = '/api/v1/fieldsets'
+_P_LICENSES = '/api/v1/licenses'
+_P_LOCATIONS = '/api/v1/locations'
+_P_MANUFACTURERS = '/api/v1/manufacturers'
+_P_MODELS = '/api/v1/models'
+_P_STATUSLABELS = '/api/v1/statuslabels'
+_P_SUPPLIERS = '/api/v1/suppliers'
+_P_USERS = '/api/v1/users'
+
+# shared field specs for create_/update_ pairs: (payload key, _validate check).
+# Both halves of a pair validate and assemble from the same spec, so the
+# accepted types cannot drift between them
+_LICENSE_SPEC = (('name', 'str'), ('seats', 'int'), ('category_id', 'int'), ('product_key', 'str'), ('company_id', 'int'), ('expiration_date', 'date'), ('license_email', 'str'), ('license_name', 'str'), ('maintained', 'bool'), ('manufacturer_id', 'int'), ('notes', 'str'), ('order_number', 'int'), ('purchase_cost', 'float'), ('purchase_date', 'date'), ('purchase_order', 'str'), ('reassignable', 'bool'), ('serial', 'str'), ('supplier_id', 'int'), ('termination_date', 'date'))
+_LOCATION_SPEC = (('name', 'str'), ('address', 'str'), ('address2', 'str'), ('city', 'str'), ('state', 'str'), ('country', 'str'), ('zip', 'str'))
+_MODEL_SPEC = (('name', 'str'), ('category_id', 'int'), ('manufacturer_id', 'int'), ('model_number', 'str'), ('eol', 'int'), ('fieldset_id', 'int'))
+_USER_SPEC = (('first_name', 'str'), ('username', 'str'), ('password', 'str'), ('password_confirmation', 'str'), ('last_name', 'str'), ('email', 'str'), ('permissions', 'str'), ('activated', 'bool'), ('phone', 'str'), ('jobtitle', 'str'), ('manager_id', 'int'), ('employee_num', 'str'), ('notes', 'str'), ('company_id', 'int'), ('two_factor_enrolled', 'bool'), ('two_factor_optin', 'bool'), ('department_id', 'int'), ('location_id', 'int'))
+_SUPPLIER_SPEC = (('name', 'str'), ('address', 'str'), ('address2', 'str'), ('state', 'str'), ('city', 'str'), ('country', 'str'), ('zip', 'str'), ('contact', 'str'), ('phone', 'str'), ('fax', 'str'), ('email', 'str'), ('url', 'str'), ('notes', 'str'))
+
+# status label type names mapped to their (deployable, pending, archived) flags
+_STATUS_FLAGS = {
+    'deployable': (True, False, False),
+    'pending': (False, True, False),
+    'archived': (False, False, True),
+}
+
+# record kinds resolve_names understands, mapped to the list method that
+# serves them and whether that method accepts limit/offset pagination
+_RESOLVE_KINDS = {
+    'accessory': ('get_accessories', True),
+    'asset': ('get_assets', True),
+    'category': ('get_categories', True),
+    'company': ('get_companies', False),
+    'component': ('get_components', True),
+    'consumable': ('get_consumables', True),
+    'license': ('get_licenses', True),
+    'location': ('get_locations', True),
+    'manufacturer': ('get_manufacturers', False),
+    'model': ('get_models', True),
+    'status_label': ('get_status_labels', True),
+    'user': ('get_users', True),
+}
+
+_SORT_FIELDS = frozenset({'id', 'name', 'asset_tag', 'serial', 'model', 'model_number', 'last_checkout', 'category', 'manufacturer', 'notes', 'expected_checkin', 'order_number', 'companyName', 'location', 'image', 'status_label', 'assigned_to', 'created_at', 'purchase_date', 'purchase_cost'})
+_ORDERS = frozenset({'asc', 'desc'})
+_FIELD_ELEMENTS = frozenset({'text', 'listbox', 'textarea'})
+_FIELD_FORMATS = frozenset({'ANY', 'CUSTOM REGEX', 'ALPHA', 'ALPHA-DASH', 'NUMERIC', 'ALPHA-NUMERIC', 'EMAIL', 'DATE', 'URL', 'IP', 'IPV4', 'IPV6', 'MAC', 'BOOLEAN'})
+_CATEGORY_TYPES = frozenset({'asset', 'accessory', 'consumable', 'component', 'license'})
 
 
 class SnipeAPI(object):
@@ -10,9 +208,11 @@ class SnipeAPI(object):
     Class representing a Snipe-It API version 4.8.0
     """
 
-    def __init__(self, server, token):
+    __slots__ = ('_server', '_token', '_session', '_headers', '_cache_ttl', '_name_cache', '_name_index', '_response_cache', '_body_key')
+
+    def __init__(self, server, token, http2=False, cache_ttl=0):
         """
-        init(server, token)
+        init(server, token, http2, cache_ttl)
 
         init creates a new instance of the Snipe-IT API
 
@@ -21,18 +221,38 @@ class SnipeAPI(object):
                 ex. 'https://develop.snipeitapp.com'
             token : str : Your API token
                 ex. 'eyJ0eXAiOiJKV1QiLCJhb...'
+            http2 : bool : Use an http/2 connection so concurrent requests are multiplexed
+                over a single socket. Requires the optional httpx[http2] package
+            cache_ttl : int : Seconds to cache get_*_by_name lookups on the client.
+                0 (the default) disables caching, so every lookup hits the server
         """
         self._server = server
         self._token = token
-        self._session = requests.Session()
+        self._cache_ttl = cache_ttl
+        self._name_cache = {}
+        self._name_index = {}
+        self._response_cache = {}
 
         headers = {
-            'Authorization': 'Bearer {}'.format(token),
+            'Authorization': f'Bearer {token}',
             'Accept': 'application/json',
+            'Accept-Encoding': 'gzip, deflate',
             'Content-Type': 'application/json'
         }
         self._headers = headers
-        self._session.headers.update(headers)
+        if http2:
+            if httpx is None:
+                raise ImportError('http2=True requires the httpx[http2] package')
+            self._session = httpx.Client(http2=True, headers=headers)
+            self._body_key = 'content'
+        else:
+            self._session = requests.Session()
+            self._session.headers.update(headers)
+            retries = Retry(total=_RETRY_TOTAL, backoff_factor=_RETRY_BACKOFF, status_forcelist=_RETRY_STATUSES)
+            adapter = HTTPAdapter(pool_connections=_POOL_CONNECTIONS, pool_maxsize=_POOL_MAXSIZE, max_retries=retries)
+            self._session.mount('https://', adapter)
+            self._session.mount('http://', adapter)
+            self._body_key = 'data'
 
 
 ####################################################################################################
@@ -62,7 +282,7 @@ class SnipeAPI(object):
         """
         if s is None:
             return
-        if type(s) != str:
+        if not isinstance(s, str):
             self._precondition_error('{} is not a string!'.format(s))
 
     def _precondition_int(self, i):
@@ -76,8 +296,8 @@ class SnipeAPI(object):
         """
         if i is None:
             return
-        if type(i) != int:
-            self._precondition_error('{} is not a string!'.format(i))
+        if not isinstance(i, int):
+            self._precondition_error('{} is not an integer!'.format(i))
 
     def _precondition_float(self, f):
         """
@@ -90,7 +310,7 @@ class SnipeAPI(object):
         """
         if f is None:
             return
-        if type(f) != float:
+        if not isinstance(f, float):
             self._precondition_error('{} is not a float!'.format(f))
 
     def _precondition_bool(self, b):
@@ -104,7 +324,7 @@ class SnipeAPI(object):
         """
         if b is None:
             return
-        if type(b) != bool:
+        if not isinstance(b, bool):
             self._precondition_error('{} is not a boolean!'.format(b))
 
     def _precondition_enum(self, s, enum):
@@ -115,13 +335,10 @@ class SnipeAPI(object):
 
         Params:
             s : the argument to check
-            enum : list : a list of acceptable strings
+            enum : container : the acceptable strings, typically a module-level frozenset
         """
-        if s is None:
-            return
-        if s in enum:
-            return
-        self._precondition_error('{} is not in the accepted values list: {}!'.format(s, enum))
+        if s is not None and s not in enum:
+            self._precondition_error(f'{s} is not in the accepted values list: {enum}!')
 
     def _precondition_date(self, d):
         """
@@ -134,10 +351,7 @@ class SnipeAPI(object):
         """
         if d is None:
             return
-        try:
-            datetime.datetime.strptime(d, '%Y-%m-%d')
-            return
-        except ValueError:
+        if not isinstance(d, str) or not _DATE_RE.match(d):
             self._precondition_error('{} is not a date!'.format(d))
 
     def _precondition_list(self, l, item_type=None):
@@ -153,7 +367,7 @@ class SnipeAPI(object):
         """
         if l is None:
             return
-        if type(l) != list:
+        if not isinstance(l, list):
             self._precondition_error('{} is not a list!'.format(l))
         if item_type == 'str':
             for item in l:
@@ -172,36 +386,241 @@ class SnipeAPI(object):
                 self._precondition_float(item)
 
 
+    def _validate(self, schema, _types_get=_VALIDATOR_TYPES.get):
+        """
+        _validate(schema)
+
+        _validate runs every precondition check for a method in one pass. Each
+        schema entry is a (value, check) pair where check is 'str' | 'int' |
+        'float' | 'bool' | 'list' | 'date', or a container of accepted enum
+        values. None values are skipped like the individual preconditions. The
+        type table getter is bound as a default argument so the hot loop costs
+        one local call and one C-level isinstance per entry
+
+        Params:
+            schema : tuple : (value, check) pairs
+        """
+        for value, check in schema:
+            if value is None:
+                continue
+            if type(check) is str:
+                expected = _types_get(check)
+                if expected is not None:
+                    if not isinstance(value, expected):
+                        self._precondition_error(f'{value} is not a {check}!')
+                else:
+                    self._precondition_date(value)
+            else:
+                self._precondition_enum(value, check)
+
+
 ####################################################################################################
 #                                         Generic Helpers                                          #
 ####################################################################################################
 
-    def _add_to_dict(self, d, k, v):
+    def _build_payload(self, spec, **values):
+        """
+        _build_payload(spec, **values)
+
+        _build_payload validates values against a shared field spec and builds
+        the request body in one pass. create_* and update_* methods for the same
+        resource delegate to it with the same spec, so the accepted types stay
+        identical on both paths
 
+        Params:
+            spec : tuple : (payload key, check) pairs, ex. _LICENSE_SPEC
+            values : the candidate payload, keyed by spec keys
         """
-        _add_to_dict(d, k, v)
+        self._validate(tuple((values.get(key), check) for key, check in spec))
+        return _compact(**values)
 
-        add k:v to d, iff k and v are not None. if k is expand and V is not none, convert v to a
-        lowercase string first.
+    def _find_by_name(self, getter, name, **kwargs):
+        """
+        _find_by_name(getter, name, **kwargs)
+
+        _find_by_name resolves an entity by exact name. The search predicate is
+        pushed to the server, and the narrowed result is scanned with a
+        short-circuiting generator instead of a python loop over the full page
 
         Params:
-            d : dict : the dict to modify
-            k : str : the key to add
-            v : any : the value to add
+            getter : callable : a list method such as get_assets
+            name : str : the exact name to resolve
+            kwargs : extra keyword arguments forwarded to the getter
         """
+        rows = getter(search=name, **kwargs)['rows']
+        return next((row for row in rows if row['name'] == name), None)
+
+    def resolve_names(self, kind, names, threshold=25):
+        """
+        resolve_names(kind, names, threshold=25)
+
+        resolve_names maps many names of one record kind to their rows in bulk
+        and returns a name to row dict, with None for names that did not match.
+        Small batches fan the search requests out across the pooled session on a
+        worker pool, so the cost is the slowest round trip rather than the sum of
+        them. Past the threshold it is cheaper to pull the full listing once and
+        index it locally, so large batches switch to a single paginated sweep
+
+        Params:
+            kind : str : a key of _RESOLVE_KINDS, ex. 'manufacturer'
+            names : iterable : the names to resolve
+            threshold : int : batch size at which the paginated sweep takes over
+        """
+        self._precondition_enum(kind, _RESOLVE_KINDS)
+        getter_name, paginated = _RESOLVE_KINDS[kind]
+        getter = getattr(self, getter_name)
+        names = list(dict.fromkeys(names))
+        if len(names) > threshold:
+            if paginated:
+                rows = self._iter_pages(getter, 500)
+            else:
+                rows = getter()['rows']
+            index = {}
+            for row in rows:
+                index.setdefault(row['name'], row)
+            return {name: index.get(name) for name in names}
+        with concurrent.futures.ThreadPoolExecutor(max_workers=8) as executor:
+            lookup = lambda name: self._find_by_name(getter, name)
+            return dict(zip(names, executor.map(lookup, names)))
+
+    def _cached_lookup(self, family, name, fetch, index=None):
+        """
+        _cached_lookup(family, name, fetch, index=None)
+
+        _cached_lookup consults the instance name cache before calling fetch. The
+        cache is keyed by (family, name) and entries expire after the cache_ttl
+        the instance was constructed with; a ttl of 0 bypasses the cache entirely.
+        When index is given, a miss pulls the full listing once and builds a
+        family-wide name to row table, so a burst of lookups costs one fetch plus
+        hash hits instead of one request per name
+
+        Params:
+            family : str : the resource family, ex. 'companies'
+            name : str : the entity name being resolved
+            fetch : callable : a zero-argument callable that performs the lookup
+            index : callable : a zero-argument callable yielding every row of the
+                family, used to build the name index on a miss
+        """
+        if not self._cache_ttl:
+            return fetch()
+        key = (family, name)
+        now = time.monotonic()
+        hit = self._name_cache.get(key)
+        if hit is not None and now - hit[0] < self._cache_ttl:
+            return hit[1]
+        if index is not None:
+            entry = self._name_index.get(family)
+            if entry is None or now - entry[0] >= self._cache_ttl:
+                table = {}
+                for row in index():
+                    table.setdefault(row['name'], row)
+                entry = (now, table)
+                self._name_index[family] = entry
+            return entry[1].get(name)
+        value = fetch()
+        if value is not None:
+            self._name_cache[key] = (now, value)
+        return value
+
+    def _cached_get(self, family, key, fetch):
+        """
+        _cached_get(family, key, fetch)
+
+        _cached_get memoizes a whole list response for near-static reference data
+        such as fields or manufacturers. Entries honor the instance cache_ttl (0
+        bypasses the cache) and are dropped when a create_/update_/delete_ call
+        touches the same family
+
+        Params:
+            family : str : the resource family, ex. 'fields'
+            key : hashable : the request parameters that shape the response
+            fetch : callable : a zero-argument callable that issues the request
+        """
+        if not self._cache_ttl:
+            return fetch()
+        cache_key = (family, key)
+        hit = self._response_cache.get(cache_key)
+        now = time.monotonic()
+        if hit is not None and now - hit[0] < self._cache_ttl:
+            return hit[1]
+        value = fetch()
+        self._response_cache[cache_key] = (now, value)
+        return value
+
+    def _invalidate(self, family):
+        """
+        _invalidate(family)
+
+        _invalidate drops every cached response and name lookup for a resource
+        family. Called by the mutating methods so local writes are never shadowed
+        by stale cache entries
+
+        Params:
+            family : str : the resource family to drop, ex. 'fields'
+        """
+        self._name_index.pop(family, None)
+        for cache in (self._response_cache, self._name_cache):
+            for key in [k for k in cache if k[0] == family]:
+                del cache[key]
+
+    def _iter_pages(self, getter, page_size, **filters):
+        """
+        _iter_pages(getter, page_size, **filters)
+
+        _iter_pages yields every row from a paginated list endpoint. The next page
+        is requested on a background thread while the caller consumes the current
+        one, overlapping server latency with client side work. The persistent
+        session is reused, so keep-alive is preserved across pages
+
+        Params:
+            getter : callable : a list method such as get_assets
+            page_size : int : the number of rows to request per page
+            filters : extra keyword arguments forwarded to the getter
+        """
+        with concurrent.futures.ThreadPoolExecutor(max_workers=1) as executor:
+            offset = 0
+            future = executor.submit(getter, limit=page_size, offset=offset, **filters)
+            while True:
+                rows = future.result()['rows']
+                if len(rows) == page_size:
+                    offset += page_size
+                    future = executor.submit(getter, limit=page_size, offset=offset, **filters)
+                else:
+                    future = None
+                yield from rows
+                if future is None:
+                    return
+
+    def _iter_rows(self, path, params):
+        """
+        _iter_rows(path, params)
+
+        _iter_rows streams a list endpoint response and yields rows as they parse
+        off the socket, so peak memory stays at one row instead of one page and
+        parsing overlaps with the network transfer. Falls back to a fully parsed
+        response when the optional ijson package is unavailable or the session is
+        not the streaming requests transport
+
+        Params:
+            path : str : the path to send the request to
+            params : dict : the query params for the request
+        """
+        if ijson is None or not isinstance(self._session, requests.Session):
+            yield from self._get(path, params)['rows']
+            return
+        url = self._server + path
+        resp = self._session.get(url, params=params or None, stream=True)
+        resp.raw.decode_content = True
+        yield from ijson.items(resp.raw, 'rows.item')
 
-        if k == 'expand' and v:
-            v = str(v).lower()
-        if k and v:
-            d[k] = v
 
 ####################################################################################################
 #                                           HTTP Methods                                           #
 ####################################################################################################
 
-    def _get(self, path, params):
+    def _get(self, path, params, parse=True):
         """
-        _get(path, params)
+        _get(path, params, parse)
 
         this is a wrapper around the python requests get function
 
@@ -209,87 +628,96 @@ class SnipeAPI(object):
         Params:
             path : str : the path to send the request to
             params : dict : the params to pass to the request function
+            parse : bool : decode the response body as JSON. When False the raw
+                response object is returned and no decoding work is done
         """
         url = self._server + path
 
         if params:
-            data = json.dumps(params)
-            resp = self._session.get(url, params=data)
+            resp = self._session.get(url, params=params)
         else:
             resp = self._session.get(url)
-        return resp.json()
+        return _decode(resp) if parse else resp
 
-    def _post(self, path, payload):
+    def _post(self, path, payload, parse=True):
         """
-        _post(path, payload)
+        _post(path, payload, parse)
 
         this is a wrapper around the python requests post function
 
         Params:
             path : str : the path to send the request to
             payload : dict : the params to pass to the request function
+            parse : bool : decode the response body as JSON. When False the raw
+                response object is returned and no decoding work is done
         """
         url = self._server + path
         if payload:
-            data = json.dumps(payload)
-            resp = self._session.post(url, data=data)
+            data = _json_dumps(payload)
+            resp = self._session.post(url, **{self._body_key: data})
         else:
             resp = self._session.post(url)
-        return resp.json()
+        return _decode(resp) if parse else resp
 
-    def _put(self, path, payload):
+    def _put(self, path, payload, parse=True):
         """
-        _put(path, payload)
+        _put(path, payload, parse)
 
         this is a wrapper around the python requests put function
 
         Params:
             path : str : the path to send the request to
             payload : dict : the params to pass to the request function
+            parse : bool : decode the response body as JSON. When False the raw
+                response object is returned and no decoding work is done
         """
         url = self._server + path
         if payload:
-            data = json.dumps(payload)
-            resp = self._session.put(url, data=data)
+            data = _json_dumps(payload)
+            resp = self._session.put(url, **{self._body_key: data})
         else:
             resp = self._session.put(url)
-        return resp.json()
+        return _decode(resp) if parse else resp
 
-    def _patch(self, path, payload):
+    def _patch(self, path, payload, parse=True):
         """
-        _patch(path, payload)
+        _patch(path, payload, parse)
 
         this is a wrapper around the python requests patch function
 
         Params:
             path : str : the path to send the request to
             payload : dict : the params to pass to the request function
+            parse : bool : decode the response body as JSON. When False the raw
+                response object is returned and no decoding work is done
         """
         url = self._server + path
         if payload:
-            data = json.dumps(payload)
-            resp = self._session.patch(url, data=data)
+            data = _json_dumps(payload)
+            resp = self._session.patch(url, **{self._body_key: data})
         else:
             resp = self._session.patch(url)
-        return resp.json()
+        return _decode(resp) if parse else resp
 
-    def _delete(self, path, payload):
+    def _delete(self, path, payload, parse=True):
         """
-        _delete(path, payload)
+        _delete(path, payload, parse)
 
         this is a wrapper around the python requests delete function
 
         Params:
             path : str : the path to send the request to
             payload : dict : the params to pass to the request function
+            parse : bool : decode the response body as JSON. When False the raw
+                response object is returned and no decoding work is done
         """
         url = self._server + path
         if payload:
-            data = json.dumps(payload)
-            resp = self._session.delete(url, data=data)
+            data = _json_dumps(payload)
+            resp = self._session.request('DELETE', url, **{self._body_key: data})
         else:
             resp = self._session.delete(url)
-        return resp.json()
+        return _decode(resp) if parse else resp
 
 
 ####################################################################################################
@@ -309,20 +737,9 @@ class SnipeAPI(object):
         self._precondition_int(location_id)
         self._precondition_int(manufacturer_id)
         self._precondition_int(supplier_id)
-        payload = {
-            'name': name,
-            'qty': qty,
-            'category_id': category_id
-        }
-        self._add_to_dict(payload, 'order_number', order_number)
-        self._add_to_dict(payload, 'purchase_cost', purchase_cost)
-        self._add_to_dict(payload, 'purchase_date', purchase_date)
-        self._add_to_dict(payload, 'model_number', model_number)
-        self._add_to_dict(payload, 'company_id', company_id)
-        self._add_to_dict(payload, 'location_id', location_id)
-        self._add_to_dict(payload, 'manufacturer_id', manufacturer_id)
-        self._add_to_dict(payload, 'supplier_id', supplier_id)
-        path = '/api/v1/accessories'
+        payload = _compact(name=name, qty=qty, category_id=category_id, order_number=order_number, purchase_cost=purchase_cost, purchase_date=purchase_date, model_number=model_number, company_id=company_id, location_id=location_id, manufacturer_id=manufacturer_id, supplier_id=supplier_id)
+        path = _P_ACCESSORIES
+        self._invalidate('accessories')
         return self._post(path, payload)
 
     def get_accessories(self, limit=None, offset=None, search=None, order_number=None, sort=None, order=None, expand=None):
@@ -330,32 +747,23 @@ class SnipeAPI(object):
         self._precondition_int(offset)
         self._precondition_str(search)
         self._precondition_str(order_number)
-        self._precondition_enum(sort, ['id', 'name', 'asset_tag', 'serial', 'model', 'model_number', 'last_checkout', 'category', 'manufacturer', 'notes', 'expected_checkin', 'order_number', 'companyName', 'location', 'image', 'status_label', 'assigned_to', 'created_at', 'purchase_date', 'purchase_cost'])
-        self._precondition_enum(order, ['asc', 'desc'])
+        self._precondition_enum(sort, _SORT_FIELDS)
+        self._precondition_enum(order, _ORDERS)
         self._precondition_bool(expand)
-        params = {}
-        self._add_to_dict(params, 'limit', limit)
-        self._add_to_dict(params, 'offset', offset)
-        self._add_to_dict(params, 'search', search)
-        self._add_to_dict(params, 'order_number', order_number)
-        self._add_to_dict(params, 'sort', sort)
-        self._add_to_dict(params, 'order', order)
-        self._add_to_dict(params, 'expand', expand)
-        params = str(params)
-        path = '/api/v1/accessories'
+        params = _compact(limit=limit, offset=offset, search=search, order_number=order_number, sort=sort, order=order, expand=expand)
+        path = _P_ACCESSORIES
         return self._get(path, params)
 
-    def get_accessory_by_id(self, accessory_id):
-        self._precondition_int(accessory_id)
-        path = '/api/v1/accessories/{}'.format(accessory_id)
-        return self._get(path, None)
+    def iter_accessories(self, page_size=500, **filters):
+        return self._iter_pages(self.get_accessories, page_size, **filters)
+
+    def iter_accessories_raw(self, **filters):
+        return self._iter_rows(_P_ACCESSORIES, _compact(**filters))
+
+    get_accessory_by_id = _make_get_by_id(_P_ACCESSORIES)
 
     def get_accessory_by_name(self, name):
-        accessories = self.get_accessories(search=name)
-        for accessory in accessories['rows']:
-            if accessory['name'] == name:
-                return accessory
-        return None
+        return self._cached_lookup('accessories', name, lambda: self._find_by_name(self.get_accessories, name, limit=50), index=lambda: self._iter_pages(self.get_accessories, 500))
 
 
 ####################################################################################################
@@ -368,19 +776,40 @@ class SnipeAPI(object):
         self._precondition_int(status_id)
         self._precondition_int(model_id)
         self._precondition_str(name)
-        payload = {
-            'status_id': status_id,  # int
-            'model_id': model_id,  # int
-        }
-        self._add_to_dict(payload, 'asset_tag', asset_tag)
-        self._add_to_dict(payload, 'name', name)
-        path = '/api/v1/hardware'
+        payload = _compact(status_id=status_id, model_id=model_id, asset_tag=asset_tag, name=name)
+        path = _P_HARDWARE
+        self._invalidate('assets')
         return self._post(path, payload)
 
-    def delete_asset(self, asset_id):
-        self._precondition_int(asset_id)
-        path = '/api/v1/hardware/{}'.format(asset_id)
-        return self._delete(path, None)
+    def create_assets_bulk(self, items):
+        """
+        create_assets_bulk(items)
+
+        create_assets_bulk creates many assets from one call. Snipe-IT does not
+        expose a bulk hardware endpoint, so each item still becomes one POST, but
+        every payload is validated up front and the requests fan out across a
+        worker pool on the pooled keep-alive session, so a batch costs roughly
+        ceil(n / workers) round trips and no fresh TCP/TLS handshakes. Results
+        come back in item order
+
+        Params:
+            items : list : one dict of create_asset arguments per asset, ex.
+                [{'status_id': 2, 'model_id': 24, 'name': 'pc1'}]
+        """
+        payloads = []
+        for item in items:
+            self._precondition_int(item['status_id'])
+            self._precondition_int(item['model_id'])
+            self._precondition_str(item.get('asset_tag'))
+            self._precondition_str(item.get('name'))
+            payloads.append(_compact(status_id=item['status_id'], model_id=item['model_id'], asset_tag=item.get('asset_tag'), name=item.get('name')))
+        self._invalidate('assets')
+        if len(payloads) < 2:
+            return [self._post(_P_HARDWARE, payload) for payload in payloads]
+        with concurrent.futures.ThreadPoolExecutor(max_workers=8) as executor:
+            return list(executor.map(lambda payload: self._post(_P_HARDWARE, payload), payloads))
+
+    delete_asset = _make_delete(_P_HARDWARE, invalidate='assets')
 
     def get_assets(self, limit=None, offset=None, search=None, order_number=None, sort=None, order=None, model_id=None, category_id=None, manufacturer_id=None, company_id=None, location_id=None, status=None, status_id=None):
 
@@ -395,94 +824,49 @@ class SnipeAPI(object):
         self._precondition_int(location_id)
         self._precondition_str(status)
         self._precondition_str(status_id)
-        self._precondition_enum(sort, ['id', 'name', 'asset_tag', 'serial', 'model', 'model_number', 'last_checkout', 'category', 'manufacturer', 'notes', 'expected_checkin', 'order_number', 'companyName', 'location', 'image', 'status_label', 'assigned_to', 'created_at', 'purchase_date', 'purchase_cost'])
-        self._precondition_enum(order, ['asc', 'desc'])
-
-        path = '/api/v1/hardware'
-        params = {}
-        self._add_to_dict(params, 'limit', limit)
-        self._add_to_dict(params, 'offset', offset)
-        self._add_to_dict(params, 'search', search)
-        self._add_to_dict(params, 'order_number', order_number)
-        self._add_to_dict(params, 'sort', sort)
-        self._add_to_dict(params, 'order', order)
-        self._add_to_dict(params, 'model_id', model_id)
-        self._add_to_dict(params, 'category_id', category_id)
-        self._add_to_dict(params, 'manufacturer_id', manufacturer_id)
-        self._add_to_dict(params, 'company_id', company_id)
-        self._add_to_dict(params, 'location_id', location_id)
-        self._add_to_dict(params, 'status', status)
-        self._add_to_dict(params, 'status_id', status_id)
+        self._precondition_enum(sort, _SORT_FIELDS)
+        self._precondition_enum(order, _ORDERS)
+
+        path = _P_HARDWARE
+        params = _compact(limit=limit, offset=offset, search=search, order_number=order_number, sort=sort, order=order, model_id=model_id, category_id=category_id, manufacturer_id=manufacturer_id, company_id=company_id, location_id=location_id, status=status, status_id=status_id)
 
         return self._get(path, params)
 
-    def get_asset_by_id(self, asset_id):
-        self._precondition_int(asset_id)
-        path = '/api/v1/hardware/{}'.format(asset_id)
-        return self._get(path, None)
+    def iter_assets(self, page_size=500, **filters):
+        return self._iter_pages(self.get_assets, page_size, **filters)
+
+    def iter_assets_raw(self, **filters):
+        return self._iter_rows(_P_HARDWARE, _compact(**filters))
+
+    get_asset_by_id = _make_get_by_id(_P_HARDWARE)
 
     def get_asset_by_name(self, name):
-        assets = self.get_assets(search=name)
-        for asset in assets['rows']:
-            if asset['name'] == name:
-                return asset
-        return None
+        return self._cached_lookup('assets', name, lambda: self._find_by_name(self.get_assets, name, limit=50))
 
     def get_asset_by_serial(self, asset_serial):
         self._precondition_str(asset_serial)
-        path = '/api/v1/hardware/byserial/{}'.format(asset_serial)
+        path = _P_HARDWARE + '/byserial/' + asset_serial
         return self._get(path, None)
 
     def get_asset_by_tag(self, asset_tag):
         self._precondition_str(asset_tag)
-        path = '/api/v1/hardware/bytag/{}'.format(asset_tag)
+        path = _P_HARDWARE + '/bytag/' + asset_tag
         return self._get(path, None)
 
     def get_assets_by_status_id(self, status_label_id):
         self._precondition_int(status_label_id)
-        path = '/api/v1/statuslabels/{}/assetlist'.format(status_label_id)
+        path = '/api/v1/statuslabels/' + str(status_label_id) + '/assetlist'
         return self._get(path, None)
 
 
     def update_asset(self, asset_id, asset_tag=None, notes=None, status_id=None, model_id=None, last_checkout=None, assigned_to=None, company_id=None, serial=None, order_number=None, warranty_months=None, purchase_cost=None, purchase_date=None, requestable=None, archived=None, rtd_location_id=None, name=None):
 
-        self._precondition_int(asset_id)
-        self._precondition_str(asset_tag)
-        self._precondition_str(notes)
-        self._precondition_int(status_id)
-        self._precondition_int(model_id)
-        self._precondition_date(last_checkout)
-        self._precondition_int(assigned_to)
-        self._precondition_int(company_id)
-        self._precondition_str(serial)
-        self._precondition_str(order_number)
-        self._precondition_int(warranty_months)
-        self._precondition_float(purchase_cost)
-        self._precondition_date(purchase_date)
-        self._precondition_bool(requestable)
-        self._precondition_bool(archived)
-        self._precondition_int(rtd_location_id)
-        self._precondition_str(name)
-        payload = {}
-        self._add_to_dict(payload, 'asset_tag', asset_tag)
-        self._add_to_dict(payload, 'notes', notes)
-        self._add_to_dict(payload, 'status_id', status_id)
-        self._add_to_dict(payload, 'model_id', model_id)
-        self._add_to_dict(payload, 'last_checkout', last_checkout)
-        self._add_to_dict(payload, 'assigned_to', assigned_to)
-        self._add_to_dict(payload, 'company_id', company_id)
-        self._add_to_dict(payload, 'serial', serial)
-        self._add_to_dict(payload, 'order_number', order_number)
-        self._add_to_dict(payload, 'warranty_months', warranty_months)
-        self._add_to_dict(payload, 'purchase_cost', purchase_cost)
-        self._add_to_dict(payload, 'purchase_date', purchase_date)
-        self._add_to_dict(payload, 'requestable', requestable)
-        self._add_to_dict(payload, 'archived', archived)
-        self._add_to_dict(payload, 'rtd_location_id', rtd_location_id)
-        self._add_to_dict(payload, 'name', name)
-        print(payload)
-
-        path = '/api/v1/hardware/{}'.format(asset_id)
+        self._validate(((asset_id, 'int'), (asset_tag, 'str'), (notes, 'str'), (status_id, 'int'), (model_id, 'int'), (last_checkout, 'date'), (assigned_to, 'int'), (company_id, 'int'), (serial, 'str'), (order_number, 'str'), (warranty_months, 'int'), (purchase_cost, 'float'), (purchase_date, 'date'), (requestable, 'bool'), (archived, 'bool'), (rtd_location_id, 'int'), (name, 'str')))
+        payload = _compact(asset_tag=asset_tag, notes=notes, status_id=status_id, model_id=model_id, last_checkout=last_checkout, assigned_to=assigned_to, company_id=company_id, serial=serial, order_number=order_number, warranty_months=warranty_months, purchase_cost=purchase_cost, purchase_date=purchase_date, requestable=requestable, archived=archived, rtd_location_id=rtd_location_id, name=name)
+        _log.debug('update_asset payload: %s', payload)
+
+        path = _P_HARDWARE + '/' + str(asset_id)
+        self._invalidate('assets')
         return self._patch(path, payload)
 
 ####################################################################################################
@@ -491,53 +875,33 @@ class SnipeAPI(object):
 
     def create_category(self, name, category_type, use_default_eula=None, require_acceptance=None, checkin_email=None):
         self._precondition_str(name)
-        self._precondition_enum(category_type, ['asset', 'accessory', 'consumable', 'component', 'license'])
+        self._precondition_enum(category_type, _CATEGORY_TYPES)
 
         self._precondition_bool(use_default_eula)
         self._precondition_bool(require_acceptance)
         self._precondition_bool(checkin_email)
-        payload = {
-            'name': name,  # string
-            'category_type': category_type,  # string
-        }
-        self._add_to_dict(payload, 'use_default_uela', use_default_eula)
-        self._add_to_dict(payload, 'require_acceptance', require_acceptance)
-        self._add_to_dict(payload, 'checkin_email', checkin_email)
-        path = '/api/v1/categories'
+        payload = _compact(name=name, category_type=category_type, use_default_uela=use_default_eula, require_acceptance=require_acceptance, checkin_email=checkin_email)
+        path = _P_CATEGORIES
+        self._invalidate('categories')
         return self._post(path, payload)
 
-    def delete_category(self, category_id):
-        self._precondition_int(category_id)
-        path = '/api/v1/categories/{}'.format(category_id)
-        return self._delete(path, None)
+    delete_category = _make_delete(_P_CATEGORIES, invalidate='categories')
 
     def get_categories(self, limit=None, offset=None, search=None, sort=None, order=None):
         self._precondition_int(limit)
         self._precondition_int(offset)
         self._precondition_str(search)
         self._precondition_str(sort)
-        self._precondition_enum(order, ['asc', 'desc'])
-        payload = {}
-        self._add_to_dict(payload, 'limit', limit)
-        self._add_to_dict(payload, 'offset', offset)
-        self._add_to_dict(payload, 'search', search)
-        self._add_to_dict(payload, 'sort', sort)
-        self._add_to_dict(payload, 'order', order)
-
-        path = '/api/v1/categories'
+        self._precondition_enum(order, _ORDERS)
+        payload = _compact(limit=limit, offset=offset, search=search, sort=sort, order=order)
+
+        path = _P_CATEGORIES
         return self._get(path, payload)
 
-    def get_category_by_id(self, category_id):
-        self._precondition_int(category_id)
-        path = '/api/v1/categories/{}'.format(category_id)
-        return self._get(path, None)
+    get_category_by_id = _make_get_by_id(_P_CATEGORIES)
 
     def get_category_by_name(self, name):
-        categories = self.get_categories(search=name)
-        for category in categories['rows']:
-            if category['name'] == name:
-                return category
-        return None
+        return self._cached_lookup('categories', name, lambda: self._find_by_name(self.get_categories, name, limit=50), index=lambda: self._iter_pages(self.get_categories, 500))
 
     def update_category(self, category_id, name, category_type, use_default_eula=None, require_acceptance=None, checkin_email=None):
         self._precondition_int(category_id)
@@ -546,15 +910,10 @@ class SnipeAPI(object):
         self._precondition_bool(use_default_eula)
         self._precondition_bool(require_acceptance)
         self._precondition_bool(checkin_email)
-        payload = {
-            'name': name,  # string
-            'category_type': category_type,  # string
-        }
-        self._add_to_dict(payload, 'use_default_uela', use_default_eula)
-        self._add_to_dict(payload, 'require_acceptance', require_acceptance)
-        self._add_to_dict(payload, 'checkin_email', checkin_email)
+        payload = _compact(name=name, category_type=category_type, use_default_uela=use_default_eula, require_acceptance=require_acceptance, checkin_email=checkin_email)
 
-        path = '/api/v1/categories/{}'.format(category_id)
+        path = _P_CATEGORIES + '/' + str(category_id)
+        self._invalidate('categories')
         return self._patch(path, payload)
 
 ####################################################################################################
@@ -566,32 +925,36 @@ class SnipeAPI(object):
         payload = {
             'name': name  # str
         }
-        path = '/api/v1/companies'
+        path = _P_COMPANIES
+        self._invalidate('companies')
         return self._post(path, payload)
 
-    def delete_company(self, company_id):
-        self._precondition_int(company_id)
-        path = '/api/v1/companies/{}'.format(company_id)
-        self._delete(path, None)
+    delete_company = _make_delete(_P_COMPANIES, invalidate='companies')
 
     def get_companies(self, search=None):
         self._precondition_str(search)
-        payload = {}
-        self._add_to_dict(payload, 'search', search)
-        path = '/api/v1/companies'
-        return self._get(path, None)
+        payload = _compact(search=search)
+        path = _P_COMPANIES
+        return self._get(path, payload)
 
-    def get_company_by_id(self, company_id):
-        self._precondition_int(company_id)
-        path = '/api/v1/companies/{}'.format(company_id)
-        return self._get(path, None)
+    get_company_by_id = _make_get_by_id(_P_COMPANIES)
 
     def get_company_by_name(self, name):
-        companies = self.get_companies(search=name)
+        return self._cached_lookup('companies', name, lambda: self._find_by_name(self.get_companies, name), index=lambda: self.get_companies()['rows'])
+
+    def prefetch_all_companies(self):
+        """
+        prefetch_all_companies()
+
+        prefetch_all_companies fills the name cache with every company in a single
+        request, so following get_company_by_name calls are dict hits instead of
+        round trips. Only useful when the instance was built with a nonzero
+        cache_ttl
+        """
+        companies = self.get_companies()
+        now = time.monotonic()
         for company in companies['rows']:
-            if company['name'] == name:
-                return company
-        return None
+            self._name_cache[('companies', company['name'])] = (now, company)
 
     def update_company(self, company_id, name):
         self._precondition_int(company_id)
@@ -599,7 +962,8 @@ class SnipeAPI(object):
         payload = {
             'name': name  # str
         }
-        path = '/api/v1/companies/{}'.format(company_id)
+        path = _P_COMPANIES + '/' + str(company_id)
+        self._invalidate('companies')
         return self._patch(path, payload)
 
 ####################################################################################################
@@ -615,7 +979,8 @@ class SnipeAPI(object):
             'qty': qty,  # int
             'category_id': category_id,  # int
         }
-        path = '/api/v1/components'
+        path = _P_COMPONENTS
+        self._invalidate('components')
         return self._post(path, payload)
 
     def get_components(self, limit=None, offset=None, search=None, order_number=None, sort=None, order=None, expand=None):
@@ -623,32 +988,21 @@ class SnipeAPI(object):
         self._precondition_int(offset)
         self._precondition_str(search)
         self._precondition_str(order_number)
-        self._precondition_enum(order, ['asc', 'desc'])
-        self._precondition_enum(sort, ['id', 'name', 'asset_tag', 'serial', 'model', 'model_number', 'last_checkout', 'category', 'manufacturer', 'notes', 'expected_checkin', 'order_number', 'companyName', 'location', 'image', 'status_label', 'assigned_to', 'created_at', 'purchase_date', 'purchase_cost'])
+        self._precondition_enum(order, _ORDERS)
+        self._precondition_enum(sort, _SORT_FIELDS)
         self._precondition_bool(expand)
-        payload = {}
-        self._add_to_dict(payload, 'limit', limit)
-        self._add_to_dict(payload, 'offset', offset)
-        self._add_to_dict(payload, 'search', search)
-        self._add_to_dict(payload, 'order_number', order_number)
-        self._add_to_dict(payload, 'sort', sort)
-        self._add_to_dict(payload, 'order', order)
-        self._add_to_dict(payload, 'expand', expand)
-
-        path = '/api/v1/components'
+        payload = _compact(limit=limit, offset=offset, search=search, order_number=order_number, sort=sort, order=order, expand=expand)
+
+        path = _P_COMPONENTS
         return self._get(path, payload)
 
-    def get_component_by_id(self, component_id):
-        self._precondition_int(component_id)
-        path = '/api/v1/components/{}'.format(component_id)
-        return self._get(path, None)
+    def iter_components(self, page_size=500, **filters):
+        return self._iter_pages(self.get_components, page_size, **filters)
+
+    get_component_by_id = _make_get_by_id(_P_COMPONENTS)
 
     def get_component_by_name(self, name):
-        components = self.get_components(search=name)
-        for component in components['rows']:
-            if component['name'] == name:
-                return component
-        return None
+        return self._cached_lookup('components', name, lambda: self._find_by_name(self.get_components, name, limit=50), index=lambda: self._iter_pages(self.get_components, 500))
 
 
 ####################################################################################################
@@ -665,7 +1019,8 @@ class SnipeAPI(object):
             'qty': qty,  # int
             'category_id': category_id  # int
         }
-        path = '/api/v1/consumables'
+        path = _P_CONSUMABLES
+        self._invalidate('consumables')
         return self._post(path, payload)
 
     def get_consumables(self, limit=None, offset=None, search=None, order_number=None, sort=None, order=None, expand=None, category_id=None, company_id=None, manufacturer_id=None):
@@ -673,38 +1028,24 @@ class SnipeAPI(object):
         self._precondition_int(offset)
         self._precondition_str(search)
         self._precondition_str(order_number)
-        self._precondition_enum(sort, ['id', 'name', 'asset_tag', 'serial', 'model', 'model_number', 'last_checkout', 'category', 'manufacturer', 'notes', 'expected_checkin', 'order_number', 'companyName', 'location', 'image', 'status_label', 'assigned_to', 'created_at', 'purchase_date', 'purchase_cost'])
-        self._precondition_enum(order, ['asc', 'desc'])
+        self._precondition_enum(sort, _SORT_FIELDS)
+        self._precondition_enum(order, _ORDERS)
         self._precondition_bool(expand)
         self._precondition_int(category_id)
         self._precondition_int(company_id)
         self._precondition_int(manufacturer_id)
-        payload = {}
-        self._add_to_dict(payload, 'limit', limit)
-        self._add_to_dict(payload, 'offset', offset)
-        self._add_to_dict(payload, 'search', search)
-        self._add_to_dict(payload, 'order_number', order_number)
-        self._add_to_dict(payload, 'sort', sort)
-        self._add_to_dict(payload, 'order', order)
-        self._add_to_dict(payload, 'expand', expand)
-        self._add_to_dict(payload, 'category_id', category_id)
-        self._add_to_dict(payload, 'company_id', company_id)
-        self._add_to_dict(payload, 'manufacturer_id', manufacturer_id)
-
-        path = '/api/v1/consumables'
+        payload = _compact(limit=limit, offset=offset, search=search, order_number=order_number, sort=sort, order=order, expand=expand, category_id=category_id, company_id=company_id, manufacturer_id=manufacturer_id)
+
+        path = _P_CONSUMABLES
         return self._get(path, payload)
 
-    def get_consumable_by_id(self, consumable_id):
-        self._precondition_int(consumable_id)
-        path = '/api/v1/consumables/{}'.format(consumable_id)
-        return self._get(path, None)
+    def iter_consumables(self, page_size=500, **filters):
+        return self._iter_pages(self.get_consumables, page_size, **filters)
+
+    get_consumable_by_id = _make_get_by_id(_P_CONSUMABLES)
 
     def get_consumable_by_name(self, name):
-        consumables = self.get_consumables(search=name)
-        for consumable in consumables['rows']:
-            if consumable['name'] == name:
-                return consumable
-        return None
+        return self._cached_lookup('consumables', name, lambda: self._find_by_name(self.get_consumables, name, limit=50), index=lambda: self._iter_pages(self.get_consumables, 500))
 
 
 ####################################################################################################
@@ -713,71 +1054,34 @@ class SnipeAPI(object):
 
 
     def create_field(self, name, element, field_values=None, fmt=None, custom_format=None, help_text=None, show_in_email=None, field_encrypted=None):
-        self._precondition_str(name)
-        self._precondition_enum(element, ['text', 'listbox', 'textarea'])
+        self._validate(((name, 'str'), (element, _FIELD_ELEMENTS), (fmt, _FIELD_FORMATS), (custom_format, 'str'), (help_text, 'str'), (show_in_email, 'bool'), (field_encrypted, 'bool')))
         self._precondition_list(field_values, item_type='str')
-        self._precondition_enum(fmt, ['ANY', 'CUSTOM REGEX', 'ALPHA', 'ALPHA-DASH', 'NUMERIC', 'ALPHA-NUMERIC', 'EMAIL', 'DATE', 'URL', 'IP', 'IPV4', 'IPV6', 'MAC', 'BOOLEAN'])
-        self._precondition_str(custom_format)
-        self._precondition_str(help_text)
-        self._precondition_bool(show_in_email)
-        self._precondition_bool(field_encrypted)
-        payload = {
-            'name': name,
-            'element': element,
-        }
-        self._add_to_dict(payload, 'field_values', field_values)
-        self._add_to_dict(payload, 'format', fmt)
-        self._add_to_dict(payload, 'custom_format', custom_format)
-        self._add_to_dict(payload, 'help_text', help_text)
-        self._add_to_dict(payload, 'show_in_email', show_in_email)
-        self._add_to_dict(payload, 'field_encrypted', field_encrypted)
-
-        path = '/api/v1/fields'
+        payload = _compact(name=name, element=element, field_values=field_values, format=fmt, custom_format=custom_format, help_text=help_text, show_in_email=show_in_email, field_encrypted=field_encrypted)
+
+        path = _P_FIELDS
+        self._invalidate('fields')
         return self._post(path, payload)
 
-    def delete_field(self, field_id):
-        self._precondition_int(field_id)
-        path = '/api/v1/fields/{}'.format(field_id)
-        return self._delete(path, None)
+    delete_field = _make_delete(_P_FIELDS, invalidate='fields')
 
     def get_fields(self):
-        path = '/api/v1/fields'
-        return self._get(path, None)
+        path = _P_FIELDS
+        return self._cached_get('fields', None, lambda: self._get(path, None))
 
-    def get_field_by_id(self, field_id):
-        self._precondition_int(field_id)
-        path = '/api/v1/fields/{}'.format(field_id)
-        return self._get(path, None)
+    get_field_by_id = _make_get_by_id(_P_FIELDS)
 
     def get_field_by_name(self, name):
-        fields = self.get_fields()
-        for field in fields['rows']:
-            if field['name'] == name:
-                return field
-        return None
+        def fetch():
+            return next((row for row in self.get_fields()['rows'] if row['name'] == name), None)
+        return self._cached_lookup('fields', name, fetch)
 
     def update_field(self, field_id, name, element, field_values=None, fmt=None, custom_format=None, help_text=None, show_in_email=None, field_encrypted=None):
-        self._precondition_int(field_id)
-        self._precondition_str(name)
-        self._precondition_enum(element, ['text', 'listbox', 'textarea'])
+        self._validate(((field_id, 'int'), (name, 'str'), (element, _FIELD_ELEMENTS), (fmt, _FIELD_FORMATS), (custom_format, 'str'), (help_text, 'str'), (show_in_email, 'bool'), (field_encrypted, 'bool')))
         self._precondition_list(field_values, item_type='str')
-        self._precondition_enum(fmt, ['ANY', 'CUSTOM REGEX', 'ALPHA', 'ALPHA-DASH', 'NUMERIC', 'ALPHA-NUMERIC', 'EMAIL', 'DATE', 'URL', 'IP', 'IPV4', 'IPV6', 'MAC', 'BOOLEAN'])
-        self._precondition_str(custom_format)
-        self._precondition_str(help_text)
-        self._precondition_bool(show_in_email)
-        self._precondition_bool(field_encrypted)
-        payload = {
-            'name': name,
-            'element': element,
-        }
-        self._add_to_dict(payload, 'field_values', field_values)
-        self._add_to_dict(payload, 'format', fmt)
-        self._add_to_dict(payload, 'custom_format', custom_format)
-        self._add_to_dict(payload, 'help_text', help_text)
-        self._add_to_dict(payload, 'show_in_email', show_in_email)
-        self._add_to_dict(payload, 'field_encrypted', field_encrypted)
-
-        path = '/api/v1/fields/{}'.format(field_id)
+        payload = _compact(name=name, element=element, field_values=field_values, format=fmt, custom_format=custom_format, help_text=help_text, show_in_email=show_in_email, field_encrypted=field_encrypted)
+
+        path = f'{_P_FIELDS}/{field_id}'
+        self._invalidate('fields')
         return self._patch(path, payload)
 
 
@@ -791,29 +1095,22 @@ class SnipeAPI(object):
         payload = {
             'name': name,  # str
         }
-        path = '/api/v1/fieldsets'
+        path = _P_FIELDSETS
+        self._invalidate('fieldsets')
         return self._post(path, payload)
 
-    def delete_fieldset(self, fieldset_id):
-        self._precondition_int(fieldset_id)
-        path = '/api/v1/fieldsets/{}'.format(fieldset_id)
-        return self._delete(path, None)
+    delete_fieldset = _make_delete(_P_FIELDSETS, invalidate='fieldsets')
 
     def get_fieldsets(self):
-        path = '/api/v1/fieldsets'
-        return self._get(path, None)
+        path = _P_FIELDSETS
+        return self._cached_get('fieldsets', None, lambda: self._get(path, None))
 
-    def get_fieldset_by_id(self, fieldset_id):
-        self._precondition_int(fieldset_id)
-        path = '/api/v1/fieldsets/{}'.format(fieldset_id)
-        return self._get(path, None)
+    get_fieldset_by_id = _make_get_by_id(_P_FIELDSETS)
 
     def get_fieldset_by_name(self, name):
-        fieldsets = self.get_fieldsets()
-        for fieldset in fieldsets['rows']:
-            if fieldset['name'] == name:
-                return fieldset
-        return None
+        def fetch():
+            return next((row for row in self.get_fieldsets()['rows'] if row['name'] == name), None)
+        return self._cached_lookup('fieldsets', name, fetch)
 
     def update_fieldset(self, fieldset_id, name):
         self._precondition_int(fieldset_id)
@@ -821,7 +1118,8 @@ class SnipeAPI(object):
         payload = {
             'name': name,  # str
         }
-        path = '/api/v1/fieldsets/{}'.format(fieldset_id)
+        path = f'{_P_FIELDSETS}/{fieldset_id}'
+        self._invalidate('fieldsets')
         return self._put(path, payload)
 
 ####################################################################################################
@@ -829,123 +1127,32 @@ class SnipeAPI(object):
 ####################################################################################################
 
     def create_license(self, name, seats, category_id, product_key=None, company_id=None, expiration_date=None, license_email=None, license_name=None, maintained=None, manufacturer_id=None, notes=None, order_number=None, purchase_cost=None, purchase_date=None, purchase_order=None, reassignable=None, serial=None, supplier_id=None, termination_date=None):
-        self._precondition_str(name)
-        self._precondition_int(seats)
-        self._precondition_int(category_id)
-        self._precondition_str(product_key)
-        self._precondition_int(company_id)
-        self._precondition_date(expiration_date)
-        self._precondition_str(license_email)
-        self._precondition_str(license_name)
-        self._precondition_bool(maintained)
-        self._precondition_int(manufacturer_id)
-        self._precondition_str(notes)
-        self._precondition_int(order_number)
-        self._precondition_float(purchase_cost)
-        self._precondition_date(purchase_date)
-        self._precondition_str(purchase_order)
-        self._precondition_bool(reassignable)
-        self._precondition_str(serial)
-        self._precondition_int(supplier_id)
-        self._precondition_date(termination_date)
-        payload = {
-            'name': name,
-            'seats': seats,
-            'category_id': category_id
-        }
-        self._add_to_dict(payload, 'product_key', product_key)
-        self._add_to_dict(payload, 'company_id', company_id)
-        self._add_to_dict(payload, 'expiration_date', expiration_date)
-        self._add_to_dict(payload, 'license_email', license_email)
-        self._add_to_dict(payload, 'license_name', license_name)
-        self._add_to_dict(payload, 'maintained', maintained)
-        self._add_to_dict(payload, 'manufacturer_id', manufacturer_id)
-        self._add_to_dict(payload, 'notes', notes)
-        self._add_to_dict(payload, 'order_number', order_number)
-        self._add_to_dict(payload, 'purchase_cost', purchase_cost)
-        self._add_to_dict(payload, 'purchase_date', purchase_date)
-        self._add_to_dict(payload, 'purchase_order', purchase_order)
-        self._add_to_dict(payload, 'reassignable', reassignable)
-        self._add_to_dict(payload, 'serial', serial)
-        self._add_to_dict(payload, 'supplier_id', supplier_id)
-        self._add_to_dict(payload, 'termination_date', termination_date)
-        path = '/api/v1/licenses'
+        payload = self._build_payload(_LICENSE_SPEC, name=name, seats=seats, category_id=category_id, product_key=product_key, company_id=company_id, expiration_date=expiration_date, license_email=license_email, license_name=license_name, maintained=maintained, manufacturer_id=manufacturer_id, notes=notes, order_number=order_number, purchase_cost=purchase_cost, purchase_date=purchase_date, purchase_order=purchase_order, reassignable=reassignable, serial=serial, supplier_id=supplier_id, termination_date=termination_date)
+        path = _P_LICENSES
+        self._invalidate('licenses')
         return self._post(path, payload)
 
-    def delete_license(self, license_id):
-        self._precondition_int(license_id)
-        path = '/api/v1/licenses/{}'.format(license_id)
-        return self._delete(path, None)
+    delete_license = _make_delete(_P_LICENSES, invalidate='licenses')
 
     def get_licenses(self, limit=None, offset=None, search=None, order_number=None, sort=None, order=None, expand=None):
-        self._precondition_int(limit)
-        self._precondition_int(offset)
-        self._precondition_str(search)
-        self._precondition_str(order_number)
-        self._precondition_enum(sort, ['id', 'name', 'asset_tag', 'serial', 'model', 'model_number', 'last_checkout', 'category', 'manufacturer', 'notes', 'expected_checkin', 'order_number', 'companyName', 'location', 'image', 'status_label', 'assigned_to', 'created_at', 'purchase_date', 'purchase_cost'])
-        self._precondition_enum(order, ['asc', 'desc'])
-        self._precondition_bool(expand)
-        params = {}
-        self._add_to_dict(params, 'limit', limit)
-        self._add_to_dict(params, 'offset', offset)
-        self._add_to_dict(params, 'search', search)
-        self._add_to_dict(params, 'order_number', order_number)
-        self._add_to_dict(params, 'sort', sort)
-        self._add_to_dict(params, 'order', order)
-        self._add_to_dict(params, 'expand', expand)
-        path = '/api/v1/licenses'
+        self._validate(((limit, 'int'), (offset, 'int'), (search, 'str'), (order_number, 'str'), (sort, _SORT_FIELDS), (order, _ORDERS), (expand, 'bool')))
+        params = _compact(limit=limit, offset=offset, search=search, order_number=order_number, sort=sort, order=order, expand=expand)
+        path = _P_LICENSES
         return self._get(path, params)
 
-    def get_license_by_id(self, license_id):
-        self._precondition_int(license_id)
-        path = '/api/v1/licenses/{}'.format(license_id)
-        return self._get(path, None)
+    def iter_licenses(self, page_size=500, **filters):
+        return self._iter_pages(self.get_licenses, page_size, **filters)
+
+    get_license_by_id = _make_get_by_id(_P_LICENSES)
 
     def get_license_by_name(self, name):
-        licenses = self.get_licenses(search=name)
-        for license in licenses['rows']:
-            if license['name'] == name:
-                return license
-        return None
+        return self._cached_lookup('licenses', name, lambda: self._find_by_name(self.get_licenses, name, limit=50), index=lambda: self._iter_pages(self.get_licenses, 500))
 
     def update_license(self, license_id, name=None, seats=None, company_id=None, expiration_date=None, license_email=None, license_name=None, maintained=None, manufacturer_id=None, notes=None, order_number=None, purchase_cost=None, purchase_date=None, purchase_order=None, reassignable=None, serial=None, supplier_id=None, termination_date=None):
         self._precondition_int(license_id)
-        self._precondition_str(name)
-        self._precondition_int(seats)
-        self._precondition_int(company_id)
-        self._precondition_date(expiration_date)
-        self._precondition_str(license_email)
-        self._precondition_str(license_name)
-        self._precondition_bool(maintained)
-        self._precondition_int(manufacturer_id)
-        self._precondition_str(notes)
-        self._precondition_int(order_number)
-        self._precondition_float(purchase_cost)
-        self._precondition_date(purchase_date)
-        self._precondition_str(purchase_order)
-        self._precondition_bool(reassignable)
-        self._precondition_str(serial)
-        self._precondition_int(supplier_id)
-        self._precondition_date(termination_date)
-        payload = {}
-        self._add_to_dict(payload, 'name', name)
-        self._add_to_dict(payload, 'seats', seats)
-        self._add_to_dict(payload, 'company_id', company_id)
-        self._add_to_dict(payload, 'expiration_date', expiration_date)
-        self._add_to_dict(payload, 'license_email', license_email)
-        self._add_to_dict(payload, 'license_name', license_name)
-        self._add_to_dict(payload, 'maintained', maintained)
-        self._add_to_dict(payload, 'manufacturer_id', manufacturer_id)
-        self._add_to_dict(payload, 'notes', notes)
-        self._add_to_dict(payload, 'order_number', order_number)
-        self._add_to_dict(payload, 'purchase_cost', purchase_cost)
-        self._add_to_dict(payload, 'purchase_date', purchase_date)
-        self._add_to_dict(payload, 'purchase_order', purchase_order)
-        self._add_to_dict(payload, 'reassignable', reassignable)
-        self._add_to_dict(payload, 'serial', serial)
-        self._add_to_dict(payload, 'supplier_id', supplier_id)
-        self._add_to_dict(payload, 'termination_date', termination_date)
-        path = '/api/v1/licenses/{}'.format(license_id)
+        payload = self._build_payload(_LICENSE_SPEC, name=name, seats=seats, company_id=company_id, expiration_date=expiration_date, license_email=license_email, license_name=license_name, maintained=maintained, manufacturer_id=manufacturer_id, notes=notes, order_number=order_number, purchase_cost=purchase_cost, purchase_date=purchase_date, purchase_order=purchase_order, reassignable=reassignable, serial=serial, supplier_id=supplier_id, termination_date=termination_date)
+        path = f'{_P_LICENSES}/{license_id}'
+        self._invalidate('licenses')
         return self._patch(path, payload)
 
 ####################################################################################################
@@ -953,75 +1160,32 @@ class SnipeAPI(object):
 ####################################################################################################
 
     def create_location(self, name, address=None, address2=None, city=None, state=None, country=None, zipcode=None):
-        self._precondition_str(name)
-        self._precondition_str(address)
-        self._precondition_str(address2)
-        self._precondition_str(city)
-        self._precondition_str(state)
-        self._precondition_str(country)
-        self._precondition_str(zipcode)
-        payload = {
-            'name': name,
-        }
-        self._add_to_dict(payload, 'address', address)
-        self._add_to_dict(payload, 'address2', address2)
-        self._add_to_dict(payload, 'city', city)
-        self._add_to_dict(payload, 'state', state)
-        self._add_to_dict(payload, 'country', country)
-        self._add_to_dict(payload, 'zip', zipcode)
-        path = '/api/v1/locations'
+        payload = self._build_payload(_LOCATION_SPEC, name=name, address=address, address2=address2, city=city, state=state, country=country, zip=zipcode)
+        path = _P_LOCATIONS
+        self._invalidate('locations')
         return self._post(path, payload)
 
-    def delete_location(self, location_id):
-        self._precondition_int(location_id)
-        path = '/api/v1/locations/{}'.format(location_id)
-        return self._delete(path, None)
+    delete_location = _make_delete(_P_LOCATIONS, invalidate='locations')
 
     def get_locations(self, limit=None, offset=None, search=None, sort=None, order=None):
-        self._precondition_int(limit)
-        self._precondition_int(offset)
-        self._precondition_str(search)
-        self._precondition_enum(sort, ['id', 'name', 'asset_tag', 'serial', 'model', 'model_number', 'last_checkout', 'category', 'manufacturer', 'notes', 'expected_checkin', 'order_number', 'companyName', 'location', 'image', 'status_label', 'assigned_to', 'created_at', 'purchase_date', 'purchase_cost'])
-        self._precondition_enum(order, ['asc', 'desc'])
-        payload = {}
-        self._add_to_dict(payload, 'limit', limit)
-        self._add_to_dict(payload, 'offset', offset)
-        self._add_to_dict(payload, 'search', search)
-        self._add_to_dict(payload, 'sort', sort)
-        self._add_to_dict(payload, 'order', order)
-        path = '/api/v1/locations'
+        self._validate(((limit, 'int'), (offset, 'int'), (search, 'str'), (sort, _SORT_FIELDS), (order, _ORDERS)))
+        payload = _compact(limit=limit, offset=offset, search=search, sort=sort, order=order)
+        path = _P_LOCATIONS
         return self._get(path, payload)
 
-    def get_location_by_id(self, location_id):
-        self._precondition_int(location_id)
-        path = '/api/v1/locations/{}'.format(location_id)
-        return self._get(path, None)
+    def iter_locations(self, page_size=500, **filters):
+        return self._iter_pages(self.get_locations, page_size, **filters)
+
+    get_location_by_id = _make_get_by_id(_P_LOCATIONS)
 
     def get_location_by_name(self, name):
-        locations = self.get_locations(search=name)
-        for location in locations['rows']:
-            if location['name'] == name:
-                return location
-        return None
+        return self._cached_lookup('locations', name, lambda: self._find_by_name(self.get_locations, name, limit=50), index=lambda: self._iter_pages(self.get_locations, 500))
 
     def update_location(self, location_id, name=None, address=None, address2=None, city=None, state=None, country=None, zipcode=None):
         self._precondition_int(location_id)
-        self._precondition_str(name)
-        self._precondition_str(address)
-        self._precondition_str(address2)
-        self._precondition_str(city)
-        self._precondition_str(state)
-        self._precondition_str(country)
-        self._precondition_str(zipcode)
-        payload = {}
-        self._add_to_dict(payload, 'name', name)
-        self._add_to_dict(payload, 'address', address)
-        self._add_to_dict(payload, 'address2', address2)
-        self._add_to_dict(payload, 'city', city)
-        self._add_to_dict(payload, 'state', state)
-        self._add_to_dict(payload, 'country', country)
-        self._add_to_dict(payload, 'zip', zipcode)
-        path = '/api/v1/locations/{}'.format(location_id)
+        payload = self._build_payload(_LOCATION_SPEC, name=name, address=address, address2=address2, city=city, state=state, country=country, zip=zipcode)
+        path = f'{_P_LOCATIONS}/{location_id}'
+        self._invalidate('locations')
         return self._patch(path, payload)
 
 
@@ -1031,37 +1195,14 @@ class SnipeAPI(object):
 
     def create_maintenace(self, name, address=None, address2=None, state=None, country=None, zipcode=None):
 
-        self._precondition_str(name)
-        self._precondition_str(address)
-        self._precondition_str(address2)
-        self._precondition_str(state)
-        self._precondition_str(country)
-        self._precondition_str(zipcode)
-        payload = {
-            'name': name,  # str
-        }
-        self._add_to_dict(payload, 'address', address)
-        self._add_to_dict(payload, 'address2', address2)
-        self._add_to_dict(payload, 'state', state)
-        self._add_to_dict(payload, 'country', country)
-        self._add_to_dict(payload, 'zip', zipcode)
+        self._validate(((name, 'str'), (address, 'str'), (address2, 'str'), (state, 'str'), (country, 'str'), (zipcode, 'str')))
+        payload = _compact(name=name, address=address, address2=address2, state=state, country=country, zip=zipcode)
         path = '/api/v1/maintenances'
         return self._post(path, payload)
 
     def get_maintenaces(self, limit=None, offset=None, search=None, sort=None, order=None, asset_id=None):
-        self._precondition_int(limit)
-        self._precondition_int(offset)
-        self._precondition_str(search)
-        self._precondition_enum(sort, ['id', 'name', 'asset_tag', 'serial', 'model', 'model_number', 'last_checkout', 'category', 'manufacturer', 'notes', 'expected_checkin', 'order_number', 'companyName', 'location', 'image', 'status_label', 'assigned_to', 'created_at', 'purchase_date', 'purchase_cost'])
-        self._precondition_enum(order, ['asc', 'desc'])
-        self._precondition_int(asset_id)
-        payload = {}
-        self._add_to_dict(payload, 'limit', limit)
-        self._add_to_dict(payload, 'offset', offset)
-        self._add_to_dict(payload, 'search', search)
-        self._add_to_dict(payload, 'sort', sort)
-        self._add_to_dict(payload, 'order', order)
-        self._add_to_dict(payload, 'asset_id', asset_id)
+        self._validate(((limit, 'int'), (offset, 'int'), (search, 'str'), (sort, _SORT_FIELDS), (order, _ORDERS), (asset_id, 'int')))
+        payload = _compact(limit=limit, offset=offset, search=search, sort=sort, order=order, asset_id=asset_id)
         path = '/api/v1/maintenances'
         return self._get(path, payload)
 
@@ -1074,32 +1215,22 @@ class SnipeAPI(object):
         payload = {
             'name': name,
         }
-        path = '/api/v1/manufacturers'
+        path = _P_MANUFACTURERS
+        self._invalidate('manufacturers')
         return self._post(path, payload)
 
-    def delete_manufacturer(self, manufacturer_id):
-        self._precondition_int(manufacturer_id)
-        path = '/api/v1/manufacturers/{}'.format(manufacturer_id)
-        return self._delete(path, None)
+    delete_manufacturer = _make_delete(_P_MANUFACTURERS, invalidate='manufacturers')
 
     def get_manufacturers(self, search=None):
         self._precondition_str(search)
-        payload = {}
-        self._add_to_dict(payload, 'search', search)
-        path = '/api/v1/manufacturers'
-        return self._get(path, payload)
+        payload = _compact(search=search)
+        path = _P_MANUFACTURERS
+        return self._cached_get('manufacturers', search, lambda: self._get(path, payload))
 
-    def get_manufacturer_by_id(self, manufacturer_id):
-        self._precondition_int(manufacturer_id)
-        path = '/api/v1/manufacturers/{}'.format(manufacturer_id)
-        return self._get(path, None)
+    get_manufacturer_by_id = _make_get_by_id(_P_MANUFACTURERS)
 
     def get_manufacturer_by_name(self, name):
-        manufacturers = self.get_manufacturers(search=name)
-        for manufacturer in manufacturers['rows']:
-            if manufacturer['name'] == name:
-                return manufacturer
-        return None
+        return self._cached_lookup('manufacturers', name, lambda: self._find_by_name(self.get_manufacturers, name), index=lambda: self.get_manufacturers()['rows'])
 
     def update_manufacturer(self, manufacturer_id, name):
 
@@ -1109,7 +1240,8 @@ class SnipeAPI(object):
         payload = {
             'name': name,
         }
-        path = '/api/v1/manufacturers'
+        path = f'{_P_MANUFACTURERS}/{manufacturer_id}'
+        self._invalidate('manufacturers')
         return self._patch(path, payload)
 
 ####################################################################################################
@@ -1117,72 +1249,36 @@ class SnipeAPI(object):
 ####################################################################################################
 
     def create_model(self, name, category_id, manufacturer_id, model_number=None, eol=None, fieldset_id=None):
-        self._precondition_str(name)
-        self._precondition_str(model_number)
-        self._precondition_int(category_id)
-        self._precondition_int(manufacturer_id)
-        self._precondition_int(eol)
-        self._precondition_int(fieldset_id)
-        payload = {
-            'name': name,
-            'category_id': category_id,
-            'manufacturer_id': manufacturer_id,
-        }
-        self._add_to_dict(payload, 'model_number', model_number)
-        self._add_to_dict(payload, 'eol', eol)
-        self._add_to_dict(payload, 'fieldset_id', fieldset_id)
-        path = '/api/v1/models'
+        payload = self._build_payload(_MODEL_SPEC, name=name, category_id=category_id, manufacturer_id=manufacturer_id, model_number=model_number, eol=eol, fieldset_id=fieldset_id)
+        path = _P_MODELS
+        self._invalidate('models')
         return self._post(path, payload)
 
-    def delete_model(self, model_id):
-        self._precondition_int(model_id)
-        path = '/api/v1/models/{}'.format(model_id)
-        return self._delete(path, None)
+    delete_model = _make_delete(_P_MODELS, invalidate='models')
 
     def get_models(self, limit=None, offset=None, search=None, sort=None, order=None):
         self._precondition_int(limit)
         self._precondition_int(offset)
         self._precondition_str(search)
-        self._precondition_enum(sort, ['id', 'name', 'asset_tag', 'serial', 'model', 'model_number', 'last_checkout', 'category', 'manufacturer', 'notes', 'expected_checkin', 'order_number', 'companyName', 'location', 'image', 'status_label', 'assigned_to', 'created_at', 'purchase_date', 'purchase_cost'])
-        self._precondition_enum(order, ['asc', 'desc'])
-        payload = {}
-        self._add_to_dict(payload, 'limit', limit)
-        self._add_to_dict(payload, 'offset', offset)
-        self._add_to_dict(payload, 'search', search)
-        self._add_to_dict(payload, 'sort', sort)
-        self._add_to_dict(payload, 'order', order)
-        path = '/api/v1/models'
-        return self._get(path, payload)
+        self._precondition_enum(sort, _SORT_FIELDS)
+        self._precondition_enum(order, _ORDERS)
+        payload = _compact(limit=limit, offset=offset, search=search, sort=sort, order=order)
+        path = _P_MODELS
+        return self._cached_get('models', (limit, offset, search, sort, order), lambda: self._get(path, payload))
 
-    def get_model_by_id(self, model_id):
-        self._precondition_int(model_id)
-        path = '/api/v1/models/{}'.format(model_id)
-        return self._get(path, None)
+    def iter_models(self, page_size=500, **filters):
+        return self._iter_pages(self.get_models, page_size, **filters)
+
+    get_model_by_id = _make_get_by_id(_P_MODELS)
 
     def get_model_by_name(self, name):
-        models = self.get_models(search=name)
-        for model in models['rows']:
-            if model['name'] == name:
-                return model
-        return None
+        return self._cached_lookup('models', name, lambda: self._find_by_name(self.get_models, name, limit=50), index=lambda: self._iter_pages(self.get_models, 500))
 
     def update_model(self, model_id, name, category_id, manufacturer_id, model_number=None, eol=None, fieldset_id=None):
         self._precondition_int(model_id)
-        self._precondition_str(name)
-        self._precondition_str(model_number)
-        self._precondition_int(category_id)
-        self._precondition_int(manufacturer_id)
-        self._precondition_int(eol)
-        self._precondition_int(fieldset_id)
-        payload = {
-            'name': name,
-            'category_id': category_id,
-            'manufacturer_id': manufacturer_id,
-        }
-        self._add_to_dict(payload, 'model_number', model_number)
-        self._add_to_dict(payload, 'eol', eol)
-        self._add_to_dict(payload, 'fieldset_id', fieldset_id)
-        path = '/api/v1/models/{}'.format(model_id)
+        payload = self._build_payload(_MODEL_SPEC, name=name, category_id=category_id, manufacturer_id=manufacturer_id, model_number=model_number, eol=eol, fieldset_id=fieldset_id)
+        path = f'{_P_MODELS}/{model_id}'
+        self._invalidate('models')
         return self._patch(path, payload)
 
 ####################################################################################################
@@ -1191,60 +1287,40 @@ class SnipeAPI(object):
 
     def create_status_label(self, name, type_name):
         self._precondition_str(name)
-        self._precondition_enum(type_name, ['deployable', 'pending', 'archived'])
-        payload = {
-            'name': name,  # str
-        }
-        self._add_to_dict(payload, 'type', type_name)
-        path = '/api/v1/statuslabels'
+        self._precondition_enum(type_name, _STATUS_FLAGS)
+        payload = _compact(name=name, type=type_name)
+        path = _P_STATUSLABELS
+        self._invalidate('statuslabels')
         return self._post(path, payload)
 
-    def delete_status_label(self, status_label_id):
-        self._precondition_int(status_label_id)
-        path = '/api/v1/statuslabels/{}'.format(status_label_id)
-        return self._delete(path, None)
+    delete_status_label = _make_delete(_P_STATUSLABELS, invalidate='statuslabels')
 
     def get_status_labels(self, limit=None, offset=None, search=None, sort=None, order=None):
         self._precondition_int(limit)
         self._precondition_int(offset)
         self._precondition_str(search)
-        self._precondition_enum(sort, ['id', 'name', 'asset_tag', 'serial', 'model', 'model_number', 'last_checkout', 'category', 'manufacturer', 'notes', 'expected_checkin', 'order_number', 'companyName', 'location', 'image', 'status_label', 'assigned_to', 'created_at', 'purchase_date', 'purchase_cost'])
-        self._precondition_enum(order, ['asc', 'desc'])
-        payload = {}
-        self._add_to_dict(payload, 'limit', limit)
-        self._add_to_dict(payload, 'offset', offset)
-        self._add_to_dict(payload, 'search', search)
-        self._add_to_dict(payload, 'sort', sort)
-        self._add_to_dict(payload, 'order', order)
-        path = '/api/v1/statuslabels'
-        return self._get(path, payload)
+        self._precondition_enum(sort, _SORT_FIELDS)
+        self._precondition_enum(order, _ORDERS)
+        payload = _compact(limit=limit, offset=offset, search=search, sort=sort, order=order)
+        path = _P_STATUSLABELS
+        return self._cached_get('statuslabels', (limit, offset, search, sort, order), lambda: self._get(path, payload))
 
-    def get_status_label_by_id(self, status_label_id):
-        self._precondition_int(status_label_id)
-        path = '/api/v1/statuslabels/{}'.format(status_label_id)
-        return self._get(path, None)
+    get_status_label_by_id = _make_get_by_id(_P_STATUSLABELS)
 
     def update_status_label(self, status_label_id, name, type_name):
         self._precondition_int(status_label_id)
         self._precondition_str(name)
-        self._precondition_enum(type_name, ['deployable', 'pending', 'archived'])
-
-        deployable_bool = False
-        pending_bool = False
-        archived_bool = False
-        if type_name == 'deployable':
-            deployable_bool = True
-        elif type_name == 'pending':
-            pending_bool = True
-        elif type_name == 'archived':
-            archived_bool = True
+        self._precondition_enum(type_name, _STATUS_FLAGS)
+
+        deployable_bool, pending_bool, archived_bool = _STATUS_FLAGS[type_name]
         payload = {
             'name': name,
             'deployable': deployable_bool,
             'pending': pending_bool,
             'archived': archived_bool,
         }
-        path = '/api/v1/statuslabels/{}'.format(status_label_id)
+        path = f'{_P_STATUSLABELS}/{status_label_id}'
+        self._invalidate('statuslabels')
         return self._post(path, payload)
 
 
@@ -1254,136 +1330,43 @@ class SnipeAPI(object):
 
     def create_user(self, first_name, username, password, last_name=None, email=None, permissions=None, activated=None, phone=None, jobtitle=None, manager_id=None, employee_num=None, notes=None, company_id=None, two_factor_enrolled=None, two_factor_optin=None, department_id=None, location_id=None):
 
-        self._precondition_str(first_name)
-        self._precondition_str(last_name)
-        self._precondition_str(username)
-        self._precondition_str(password)
-        self._precondition_str(email)
-        self._precondition_str(permissions)
-        self._precondition_bool(activated)
-        self._precondition_str(phone)
-        self._precondition_str(jobtitle)
-        self._precondition_int(manager_id)
-        self._precondition_str(employee_num)
-        self._precondition_str(notes)
-        self._precondition_int(company_id)
-        self._precondition_bool(two_factor_enrolled)
-        self._precondition_bool(two_factor_optin)
-        self._precondition_int(department_id)
-        self._precondition_int(location_id)
-        payload = {
-            'first_name': first_name,  # str
-            'username': username,  # str
-            'password': password,  # str
-            'password_confirmation': password,  # str
-        }
-        self._add_to_dict(payload, 'last_name', last_name)
-        self._add_to_dict(payload, 'email', email)
-        self._add_to_dict(payload, 'permissions', permissions)
-        self._add_to_dict(payload, 'activated', activated)
-        self._add_to_dict(payload, 'phone', phone)
-        self._add_to_dict(payload, 'jobtitle', jobtitle)
-        self._add_to_dict(payload, 'manager_id', manager_id)
-        self._add_to_dict(payload, 'employee_num', employee_num)
-        self._add_to_dict(payload, 'notes', notes)
-        self._add_to_dict(payload, 'company_id', company_id)
-        self._add_to_dict(payload, 'two_factor_enrolled', two_factor_enrolled)
-        self._add_to_dict(payload, 'two_factor_optin', two_factor_optin)
-        self._add_to_dict(payload, 'department_id', department_id)
-        self._add_to_dict(payload, 'location_id', location_id)
-        path = '/api/v1/users'
+        payload = self._build_payload(_USER_SPEC, first_name=first_name, username=username, password=password, password_confirmation=password, last_name=last_name, email=email, permissions=permissions, activated=activated, phone=phone, jobtitle=jobtitle, manager_id=manager_id, employee_num=employee_num, notes=notes, company_id=company_id, two_factor_enrolled=two_factor_enrolled, two_factor_optin=two_factor_optin, department_id=department_id, location_id=location_id)
+        path = _P_USERS
+        self._invalidate('users')
         return self._post(path, payload)
 
-    def delete_user(self, user_id):
-        self._precondition_int(user_id)
-        path = '/api/v1/users/{}'.format(user_id)
-        return self._delete(path, None)
+    delete_user = _make_delete(_P_USERS, invalidate='users')
 
     def get_users(self, search=None, limit=None, offset=None, sort=None, order=None, group_id=None, company_id=None, department_id=None, deleted=None):
-        self._precondition_str(search)
-        self._precondition_int(limit)
-        self._precondition_int(offset)
-        self._precondition_enum(sort, ['id', 'name', 'asset_tag', 'serial', 'model', 'model_number', 'last_checkout', 'category', 'manufacturer', 'notes', 'expected_checkin', 'order_number', 'companyName', 'location', 'image', 'status_label', 'assigned_to', 'created_at', 'purchase_date', 'purchase_cost'])
-        self._precondition_enum(order, ['asc', 'desc'])
-        self._precondition_int(group_id)
-        self._precondition_int(company_id)
-        self._precondition_int(department_id)
-        self._precondition_bool(deleted)
-        payload = {}
-        self._add_to_dict(payload, 'search', search)
-        self._add_to_dict(payload, 'limit', limit)
-        self._add_to_dict(payload, 'offset', offset)
-        self._add_to_dict(payload, 'sort', sort)
-        self._add_to_dict(payload, 'order', order)
-        self._add_to_dict(payload, 'group_id', group_id)
-        self._add_to_dict(payload, 'company_id', company_id)
-        self._add_to_dict(payload, 'department_id', department_id)
-        self._add_to_dict(payload, 'deleted', deleted)
-        path = '/api/v1/users'
+        self._validate(((search, 'str'), (limit, 'int'), (offset, 'int'), (sort, _SORT_FIELDS), (order, _ORDERS), (group_id, 'int'), (company_id, 'int'), (department_id, 'int'), (deleted, 'bool')))
+        payload = _compact(search=search, limit=limit, offset=offset, sort=sort, order=order, group_id=group_id, company_id=company_id, department_id=department_id, deleted=deleted)
+        path = _P_USERS
         return self._get(path, payload)
 
-    def get_user_by_id(self, user_id):
-        self._precondition_int(user_id)
-        path = '/api/v1/users/{}'.format(user_id)
-        return self._get(path, None)
+    def iter_users(self, page_size=500, **filters):
+        return self._iter_pages(self.get_users, page_size, **filters)
+
+    get_user_by_id = _make_get_by_id(_P_USERS)
 
     def get_user_by_name(self, name):
-        users = self.get_users(search=name)
-        for user in users['rows']:
-            if user['name'] == name:
-                return user
-        return None
+        return self._cached_lookup('users', name, lambda: self._find_by_name(self.get_users, name, limit=50))
 
     def get_users_checked_out_assets(self, user_id):
         self._precondition_int(user_id)
-        path = '/api/v1/users/{}/assets'.format(user_id)
+        path = f'{_P_USERS}/{user_id}/assets'
         return self._get(path, None)
 
     def get_users_checked_out_accessories(self, user_id):
         self._precondition_int(user_id)
-        path = '/api/v1/users/{}/accessories'.format(user_id)
+        path = f'{_P_USERS}/{user_id}/accessories'
         return self._get(path, None)
 
 
     def update_user(self, user_id, first_name=None, username=None, password=None, last_name=None, email=None, permissions=None, activated=None, phone=None, jobtitle=None, manager_id=None, employee_num=None, notes=None, company_id=None, two_factor_enrolled=None, two_factor_optin=None, department_id=None, location_id=None):
         self._precondition_int(user_id)
-        self._precondition_str(first_name)
-        self._precondition_str(last_name)
-        self._precondition_str(username)
-        self._precondition_str(password)
-        self._precondition_str(email)
-        self._precondition_str(permissions)
-        self._precondition_bool(activated)
-        self._precondition_str(phone)
-        self._precondition_str(jobtitle)
-        self._precondition_int(manager_id)
-        self._precondition_str(employee_num)
-        self._precondition_str(notes)
-        self._precondition_int(company_id)
-        self._precondition_bool(two_factor_enrolled)
-        self._precondition_bool(two_factor_optin)
-        self._precondition_int(department_id)
-        self._precondition_int(location_id)
-        payload = {}
-        self._add_to_dict(payload, 'first_name', first_name)
-        self._add_to_dict(payload, 'username', username)
-        self._add_to_dict(payload, 'password', password)
-        self._add_to_dict(payload, 'password_confirmation', password)
-        self._add_to_dict(payload, 'last_name', last_name)
-        self._add_to_dict(payload, 'email', email)
-        self._add_to_dict(payload, 'permissions', permissions)
-        self._add_to_dict(payload, 'activated', activated)
-        self._add_to_dict(payload, 'phone', phone)
-        self._add_to_dict(payload, 'jobtitle', jobtitle)
-        self._add_to_dict(payload, 'manager_id', manager_id)
-        self._add_to_dict(payload, 'employee_num', employee_num)
-        self._add_to_dict(payload, 'notes', notes)
-        self._add_to_dict(payload, 'company_id', company_id)
-        self._add_to_dict(payload, 'two_factor_enrolled', two_factor_enrolled)
-        self._add_to_dict(payload, 'two_factor_optin', two_factor_optin)
-        self._add_to_dict(payload, 'department_id', department_id)
-        self._add_to_dict(payload, 'location_id', location_id)
-        path = '/api/v1/users/{}'.format(user_id)
+        payload = self._build_payload(_USER_SPEC, first_name=first_name, username=username, password=password, password_confirmation=password, last_name=last_name, email=email, permissions=permissions, activated=activated, phone=phone, jobtitle=jobtitle, manager_id=manager_id, employee_num=employee_num, notes=notes, company_id=company_id, two_factor_enrolled=two_factor_enrolled, two_factor_optin=two_factor_optin, department_id=department_id, location_id=location_id)
+        path = f'{_P_USERS}/{user_id}'
+        self._invalidate('users')
         return self._patch(path, payload)
 
 
@@ -1393,87 +1376,187 @@ class SnipeAPI(object):
 
 
     def create_supplier(self, name, address=None, address2=None, state=None, city=None, country=None, zipcode=None, contact=None, phone=None, fax=None, email=None, url=None, notes=None):
-        self._precondition_str(name)
-        self._precondition_str(address)
-        self._precondition_str(address2)
-        self._precondition_str(state)
-        self._precondition_str(city)
-        self._precondition_str(country)
-        self._precondition_str(zipcode)
-        self._precondition_str(contact)
-        self._precondition_str(phone)
-        self._precondition_str(fax)
-        self._precondition_str(email)
-        self._precondition_str(url)
-        self._precondition_str(notes)
-        payload = {
-            'name': name,
-        }
-        self._add_to_dict(payload, 'address', address)
-        self._add_to_dict(payload, 'address2', address2)
-        self._add_to_dict(payload, 'state', state)
-        self._add_to_dict(payload, 'city', city)
-        self._add_to_dict(payload, 'country', country)
-        self._add_to_dict(payload, 'zip', zipcode)
-        self._add_to_dict(payload, 'contact', contact)
-        self._add_to_dict(payload, 'phone', phone)
-        self._add_to_dict(payload, 'fax', fax)
-        self._add_to_dict(payload, 'email', email)
-        self._add_to_dict(payload, 'url', url)
-        self._add_to_dict(payload, 'notes', notes)
-        path = '/api/v1/suppliers'
+        payload = self._build_payload(_SUPPLIER_SPEC, name=name, address=address, address2=address2, state=state, city=city, country=country, zip=zipcode, contact=contact, phone=phone, fax=fax, email=email, url=url, notes=notes)
+        path = _P_SUPPLIERS
+        self._invalidate('suppliers')
         return self._post(path, payload)
 
-    def delete_supplier(self, supplier_id):
-        self._precondition_int(supplier_id)
-        path = '/api/v1/suppliers/{}'.format(supplier_id)
-        return self._delete(path, None)
+    delete_supplier = _make_delete(_P_SUPPLIERS, invalidate='suppliers')
 
-    def get_suppliers(self):
-        path = '/api/v1/suppliers'
-        return self._get(path, None)
+    def get_suppliers(self, limit=None, offset=None, search=None):
+        self._validate(((limit, 'int'), (offset, 'int'), (search, 'str')))
+        payload = _compact(limit=limit, offset=offset, search=search)
+        path = _P_SUPPLIERS
+        return self._cached_get('suppliers', (limit, offset, search), lambda: self._get(path, payload))
 
-    def get_supplier_by_id(self, supplier_id):
-        self._precondition_int(supplier_id)
-        path = '/api/v1/suppliers/{}'.format(supplier_id)
-        return self._get(path, None)
+    def iter_suppliers(self, page_size=500, **filters):
+        return self._iter_pages(self.get_suppliers, page_size, **filters)
+
+    get_supplier_by_id = _make_get_by_id(_P_SUPPLIERS)
 
     def get_supplier_by_name(self, name):
-        suppliers = self.get_suppliers()
-        for supplier in suppliers['rows']:
-            if supplier['name'] == name:
-                return supplier
-        return None
+        return self._cached_lookup('suppliers', name, lambda: self._find_by_name(self.get_suppliers, name, limit=50), index=lambda: self._iter_pages(self.get_suppliers, 500))
 
-    def update_supplier(self, supplier_id, name, address=None, address2=None, state=None, city=None, country=None, zipcode=None, contact=None, phone=None, fax=None, email=None, url=None, notes=None):
+    def update_supplier(self, supplier_id, name=None, address=None, address2=None, state=None, city=None, country=None, zipcode=None, contact=None, phone=None, fax=None, email=None, url=None, notes=None):
         self._precondition_int(supplier_id)
-        self._precondition_str(name)
-        self._precondition_str(address)
-        self._precondition_str(address2)
-        self._precondition_str(state)
-        self._precondition_str(city)
-        self._precondition_str(country)
-        self._precondition_str(zipcode)
-        self._precondition_str(contact)
-        self._precondition_str(phone)
-        self._precondition_str(fax)
-        self._precondition_str(email)
-        self._precondition_str(url)
-        self._precondition_str(notes)
-        payload = {}
-        self._add_to_dict(payload, 'name', name)
-        self._add_to_dict(payload, 'address', address)
-        self._add_to_dict(payload, 'address2', address2)
-        self._add_to_dict(payload, 'state', state)
-        self._add_to_dict(payload, 'city', city)
-        self._add_to_dict(payload, 'country', country)
-        self._add_to_dict(payload, 'zip', zipcode)
-        self._add_to_dict(payload, 'contact', contact)
-        self._add_to_dict(payload, 'phone', phone)
-        self._add_to_dict(payload, 'fax', fax)
-        self._add_to_dict(payload, 'email', email)
-        self._add_to_dict(payload, 'url', url)
-        self._add_to_dict(payload, 'notes', notes)
-        path = '/api/v1/suppliers/{}'.format(supplier_id)
+        payload = self._build_payload(_SUPPLIER_SPEC, name=name, address=address, address2=address2, state=state, city=city, country=country, zip=zipcode, contact=contact, phone=phone, fax=fax, email=email, url=url, notes=notes)
+        path = f'{_P_SUPPLIERS}/{supplier_id}'
+        self._invalidate('suppliers')
         return self._patch(path, payload)
 
+
+####################################################################################################
+#                                            Async API                                             #
+####################################################################################################
+
+
+class AsyncSnipeAPI(SnipeAPI):
+    """
+    Asynchronous variant of the Snipe-It API backed by httpx.AsyncClient
+
+    The HTTP helpers are coroutines, so the endpoint methods inherited from
+    SnipeAPI return awaitables and fan out cleanly with asyncio.gather. The
+    helpers that consume responses in synchronous python - the get_*_by_name
+    lookups, the iter_* generators, resolve_names, create_assets_bulk and
+    prefetch_all_companies - are overridden to raise NotImplementedError; use
+    the *_by_id methods, bulk_get_assets_by_id, or asyncio.gather over the
+    endpoint coroutines instead.
+    """
+
+    __slots__ = ('_semaphore',)
+
+    get_accessory_by_name = _make_sync_only('get_accessory_by_name')
+    get_asset_by_name = _make_sync_only('get_asset_by_name')
+    get_category_by_name = _make_sync_only('get_category_by_name')
+    get_company_by_name = _make_sync_only('get_company_by_name')
+    get_component_by_name = _make_sync_only('get_component_by_name')
+    get_consumable_by_name = _make_sync_only('get_consumable_by_name')
+    get_field_by_name = _make_sync_only('get_field_by_name')
+    get_fieldset_by_name = _make_sync_only('get_fieldset_by_name')
+    get_license_by_name = _make_sync_only('get_license_by_name')
+    get_location_by_name = _make_sync_only('get_location_by_name')
+    get_manufacturer_by_name = _make_sync_only('get_manufacturer_by_name')
+    get_model_by_name = _make_sync_only('get_model_by_name')
+    get_supplier_by_name = _make_sync_only('get_supplier_by_name')
+    get_user_by_name = _make_sync_only('get_user_by_name')
+    iter_accessories = _make_sync_only('iter_accessories')
+    iter_accessories_raw = _make_sync_only('iter_accessories_raw')
+    iter_assets = _make_sync_only('iter_assets')
+    iter_assets_raw = _make_sync_only('iter_assets_raw')
+    iter_components = _make_sync_only('iter_components')
+    iter_consumables = _make_sync_only('iter_consumables')
+    iter_licenses = _make_sync_only('iter_licenses')
+    iter_locations = _make_sync_only('iter_locations')
+    iter_models = _make_sync_only('iter_models')
+    iter_suppliers = _make_sync_only('iter_suppliers')
+    iter_users = _make_sync_only('iter_users')
+    resolve_names = _make_sync_only('resolve_names')
+    create_assets_bulk = _make_sync_only('create_assets_bulk')
+    prefetch_all_companies = _make_sync_only('prefetch_all_companies')
+
+    def __init__(self, server, token, max_concurrency=32):
+        """
+        init(server, token, max_concurrency)
+
+        init creates a new instance of the asynchronous Snipe-IT API. Requires the
+        optional httpx[http2] package
+
+        Params:
+            server : str : The url that the snipe-it server is located at. No trailing slash
+                ex. 'https://develop.snipeitapp.com'
+            token : str : Your API token
+                ex. 'eyJ0eXAiOiJKV1QiLCJhb...'
+            max_concurrency : int : cap on simultaneous in-flight requests, so a
+                large gather does not trip the server's rate limits
+        """
+        if httpx is None:
+            raise ImportError('AsyncSnipeAPI requires the httpx[http2] package')
+        self._server = server
+        self._token = token
+        self._cache_ttl = 0
+        self._name_cache = {}
+        self._name_index = {}
+        self._response_cache = {}
+
+        headers = {
+            'Authorization': f'Bearer {token}',
+            'Accept': 'application/json',
+            'Accept-Encoding': 'gzip, deflate',
+            'Content-Type': 'application/json'
+        }
+        self._headers = headers
+        self._session = httpx.AsyncClient(http2=True, headers=headers)
+        self._semaphore = asyncio.Semaphore(max_concurrency)
+
+    async def __aenter__(self):
+        return self
+
+    async def __aexit__(self, exc_type, exc, tb):
+        await self.aclose()
+
+    async def aclose(self):
+        """
+        aclose()
+
+        aclose shuts down the underlying connection pool
+        """
+        await self._session.aclose()
+
+    async def _get(self, path, params, parse=True):
+        url = self._server + path
+        async with self._semaphore:
+            if params:
+                resp = await self._session.get(url, params=params)
+            else:
+                resp = await self._session.get(url)
+        return _decode(resp) if parse else resp
+
+    async def _post(self, path, payload, parse=True):
+        url = self._server + path
+        async with self._semaphore:
+            if payload:
+                resp = await self._session.post(url, content=_json_dumps(payload))
+            else:
+                resp = await self._session.post(url)
+        return _decode(resp) if parse else resp
+
+    async def _put(self, path, payload, parse=True):
+        url = self._server + path
+        async with self._semaphore:
+            if payload:
+                resp = await self._session.put(url, content=_json_dumps(payload))
+            else:
+                resp = await self._session.put(url)
+        return _decode(resp) if parse else resp
+
+    async def _patch(self, path, payload, parse=True):
+        url = self._server + path
+        async with self._semaphore:
+            if payload:
+                resp = await self._session.patch(url, content=_json_dumps(payload))
+            else:
+                resp = await self._session.patch(url)
+        return _decode(resp) if parse else resp
+
+    async def _delete(self, path, payload, parse=True):
+        url = self._server + path
+        async with self._semaphore:
+            if payload:
+                resp = await self._session.request('DELETE', url, content=_json_dumps(payload))
+            else:
+                resp = await self._session.delete(url)
+        return _decode(resp) if parse else resp
+
+    async def bulk_get_assets_by_id(self, asset_ids):
+        """
+        bulk_get_assets_by_id(asset_ids)
+
+        bulk_get_assets_by_id fetches every asset in asset_ids concurrently, so the
+        wall clock cost is roughly one round trip instead of one per asset
+
+        Params:
+            asset_ids : list : the asset ids to fetch
+        """
+        self._precondition_list(asset_ids, item_type='int')
+        return await asyncio.gather(*(self.get_asset_by_id(i) for i in asset_ids))
+
@@ -6,10 +6,7 @@ import pprint
 
 snipeapi = None
 
-
-def pp(s):
-    pprinter = pprint.PrettyPrinter(indent=4)
-    pprinter.pprint(s)
+pp = pprint.PrettyPrinter(indent=4).pprint
 
 
 def main():
@@ -26,8 +23,8 @@ def main():
         'pc1',
         'pc2',
     ]
-    for name in names:
-        snipeapi.create_asset(ready_to_deploy, vm_model, name=name)
+    items = [{'status_id': ready_to_deploy, 'model_id': vm_model, 'name': name} for name in names]
+    snipeapi.create_assets_bulk(items)
 
 
 